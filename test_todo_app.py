@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 """
-Test script for the Todo application.
+Test suite for the Todo application.
 
-This script demonstrates the functionality of the Todo application
-by performing various operations and verifying the expected outcomes.
+Run with pytest:
+
+    python -m pytest -q
 """
 
-from todo_app import TodoManager, Task
+import io
+
+import pytest
+
+from todo_app import TodoManager, TodoCLI, Task, _parse_id
+
+
+def run_cli(monkeypatch, *lines):
+    """Run a TodoCLI session on piped input lines and return the CLI."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(line + "\n" for line in lines)))
+    cli = TodoCLI()
+    cli.run()
+    return cli
 
 
 def test_task_creation():
     """Test basic task creation."""
-    print("Testing task creation...")
-
-    # Test valid task creation
     manager = TodoManager()
     task = manager.add_task("Test task", "This is a test description")
 
@@ -22,52 +32,65 @@ def test_task_creation():
     assert task.completed == False
     assert task.id == 1
 
-    print("PASS: Task creation works correctly")
 
+def test_task_creation_strips_whitespace():
+    """Test that surrounding whitespace is stripped from title and description."""
+    manager = TodoManager()
+    task = manager.add_task("  Padded task  ", "  Padded description  ")
+
+    assert task.title == "Padded task"
+    assert task.description == "Padded description"
+    assert manager.get_task(task.id).title == "Padded task"
 
-def test_task_validation():
-    """Test task validation."""
-    print("\nTesting task validation...")
 
+@pytest.mark.parametrize("bad_title", ["", "   "])
+def test_task_validation(bad_title):
+    """Test that empty and whitespace-only titles are rejected."""
     manager = TodoManager()
 
-    # Test empty title validation
-    try:
-        manager.add_task("")
-        assert False, "Should have raised ValueError for empty title"
-    except ValueError:
-        print("PASS: Empty title validation works correctly")
+    with pytest.raises(ValueError):
+        manager.add_task(bad_title)
+    assert len(manager.get_all_tasks()) == 0
 
-    # Test whitespace-only title validation
-    try:
-        manager.add_task("   ")
-        assert False, "Should have raised ValueError for whitespace-only title"
-    except ValueError:
-        print("PASS: Whitespace-only title validation works correctly")
+
+@pytest.mark.parametrize("bad_title", ["", "   "])
+def test_try_add_task_reports_invalid_title(bad_title):
+    """Test that try_add_task reports an empty title without raising."""
+    manager = TodoManager()
+
+    assert manager.try_add_task(bad_title) == (False, None, "Task title cannot be empty")
+    assert len(manager.get_all_tasks()) == 0
+
+
+def test_try_add_task():
+    """Test that try_add_task adds a valid task."""
+    manager = TodoManager()
+    added, task, error = manager.try_add_task(" Task ", "Details")
+
+    assert added == True
+    assert error == ""
+    assert task.title == "Task"
+    assert manager.get_task(task.id).description == "Details"
 
 
 def test_task_operations():
     """Test basic task operations."""
-    print("\nTesting task operations...")
-
     manager = TodoManager()
 
     # Add a task
-    task1 = manager.add_task("First task", "Description 1")
-    task2 = manager.add_task("Second task", "Description 2")
+    manager.add_task("First task", "Description 1")
+    manager.add_task("Second task", "Description 2")
 
     # Test listing tasks
     all_tasks = manager.get_all_tasks()
     assert len(all_tasks) == 2
     assert all_tasks[0].id == 1
     assert all_tasks[1].id == 2
-    print("PASS: Task listing works correctly")
 
     # Test getting specific task
     retrieved_task = manager.get_task(1)
     assert retrieved_task is not None
     assert retrieved_task.title == "First task"
-    print("PASS: Task retrieval works correctly")
 
     # Test updating task
     updated = manager.update_task(1, "Updated task", "Updated description")
@@ -75,7 +98,6 @@ def test_task_operations():
     updated_task = manager.get_task(1)
     assert updated_task.title == "Updated task"
     assert updated_task.description == "Updated description"
-    print("PASS: Task update works correctly")
 
     # Test toggling completion
     initial_status = updated_task.completed
@@ -83,45 +105,37 @@ def test_task_operations():
     assert toggled == True
     task_after_toggle = manager.get_task(1)
     assert task_after_toggle.completed != initial_status
-    print("PASS: Task completion toggle works correctly")
+    assert manager.toggle_completion(1) == False
+    assert manager.get_task(1).completed == initial_status
+
+    # Test counting completed tasks
+    assert manager.count_completed() == 0
+    manager.toggle_completion(1)
+    manager.toggle_completion(2)
+    assert manager.count_completed() == 2
+    manager.toggle_completion(2)
+    assert manager.count_completed() == 1
 
     # Test deleting task
     deleted = manager.delete_task(2)
     assert deleted == True
     assert manager.get_task(2) is None
-    print("PASS: Task deletion works correctly")
 
 
-def test_task_not_found():
+@pytest.mark.parametrize("operation, expected", [
+    (lambda manager: manager.get_task(999), None),
+    (lambda manager: manager.update_task(999, "New title"), False),
+    (lambda manager: manager.toggle_completion(999), None),
+    (lambda manager: manager.delete_task(999), False),
+], ids=["get", "update", "toggle", "delete"])
+def test_task_not_found(operation, expected):
     """Test operations on non-existent tasks."""
-    print("\nTesting operations on non-existent tasks...")
-
     manager = TodoManager()
-
-    # Try to get non-existent task
-    assert manager.get_task(999) is None
-    print("PASS: Non-existent task retrieval handled correctly")
-
-    # Try to update non-existent task
-    updated = manager.update_task(999, "New title")
-    assert updated == False
-    print("PASS: Non-existent task update handled correctly")
-
-    # Try to toggle completion of non-existent task
-    toggled = manager.toggle_completion(999)
-    assert toggled == False
-    print("PASS: Non-existent task toggle handled correctly")
-
-    # Try to delete non-existent task
-    deleted = manager.delete_task(999)
-    assert deleted == False
-    print("PASS: Non-existent task deletion handled correctly")
+    assert operation(manager) is expected
 
 
 def test_task_update_partial():
     """Test partial task updates."""
-    print("\nTesting partial task updates...")
-
     manager = TodoManager()
     task = manager.add_task("Original title", "Original description")
 
@@ -130,35 +144,198 @@ def test_task_update_partial():
     updated_task = manager.get_task(task.id)
     assert updated_task.title == "New title"
     assert updated_task.description == "Original description"  # Should remain unchanged
-    print("PASS: Partial title update works correctly")
 
     # Update only description
     manager.update_task(task.id, description="New description")
     updated_task = manager.get_task(task.id)
     assert updated_task.title == "New title"  # Should remain unchanged
     assert updated_task.description == "New description"
-    print("PASS: Partial description update works correctly")
 
 
-def run_tests():
-    """Run all tests."""
-    print("Running tests for Todo application...\n")
+def test_task_update_validation():
+    """Test title validation and whitespace handling in updates."""
+    manager = TodoManager()
+    task = manager.add_task("Title", "Description")
+
+    with pytest.raises(ValueError):
+        manager.update_task(task.id, "   ")
+    assert manager.get_task(task.id).title == "Title"
+
+    # An invalid title on a missing task reports "not found" rather than raising
+    assert manager.update_task(999, "") == False
+
+    manager.update_task(task.id, "  Spaced title  ", "  Spaced description  ")
+    updated_task = manager.get_task(task.id)
+    assert updated_task.title == "Spaced title"
+    assert updated_task.description == "Spaced description"
+
+    # An empty description clears it
+    manager.update_task(task.id, description="")
+    assert manager.get_task(task.id).description is None
+
+
+def test_task_delete_keeps_order():
+    """Test that deleting a task keeps the remaining tasks in order."""
+    manager = TodoManager()
+    for title in ("One", "Two", "Three", "Four"):
+        manager.add_task(title)
+
+    assert manager.delete_task(2) == True
+    assert [task.id for task in manager.get_all_tasks()] == [1, 3, 4]
+    assert manager.get_task(3).title == "Three"
+    assert manager.get_task(4).title == "Four"
+
+    # Later tasks are still found and updatable after the deletion
+    assert manager.toggle_completion(4) == True
+    assert manager.update_task(3, "Third", "Updated") == True
+    assert manager.get_task(4).completed == True
+    assert manager.get_task(3).completed == False
+    assert manager.get_task(3).title == "Third"
+    assert manager.get_task(3).description == "Updated"
+    assert manager.count_completed() == 1
+
+
+def test_task_delete_many_keeps_state():
+    """Test that deleting most tasks keeps the survivors intact and in order."""
+    manager = TodoManager()
+    for number in range(1, 11):
+        manager.add_task(f"Task {number}")
+    manager.toggle_completion(3)
+    manager.toggle_completion(10)
+
+    # Delete completed and pending tasks from the middle and both ends
+    for task_id in (1, 2, 3, 5, 6, 8, 9):
+        assert manager.delete_task(task_id) == True
+    assert manager.delete_task(3) == False
+
+    assert [task.id for task in manager.get_all_tasks()] == [4, 7, 10]
+    assert manager.count_completed() == 1
+    assert manager.get_task(5) is None
+
+    assert manager.toggle_completion(7) == True
+    assert manager.update_task(10, "Last task") == True
+    assert [str(task) for task in manager.get_all_tasks()] == [
+        "[○] 4: Task 4", "[✓] 7: Task 7", "[✓] 10: Last task",
+    ]
+
+    # New tasks are appended after the survivors
+    manager.add_task("Task 11")
+    assert [task.id for task in manager.get_all_tasks()] == [4, 7, 10, 11]
+
+
+def test_task_list_cache():
+    """Test that the cached task listing is refreshed after changes."""
+    manager = TodoManager()
+    manager.add_task("First task")
+    first = manager._cached_tasks()
+    assert manager._cached_tasks() is first
+
+    manager.add_task("Second task")
+    assert [task.title for task in manager._cached_tasks()] == ["First task", "Second task"]
+
+    manager.update_task(1, "Renamed task")
+    assert manager._cached_tasks()[0].title == "Renamed task"
+
+    manager.toggle_completion(2)
+    assert manager._cached_tasks()[1].completed == True
+
+    manager.delete_task(1)
+    assert [task.id for task in manager._cached_tasks()] == [2]
+
+
+def test_get_all_tasks_returns_independent_tasks():
+    """Test that modifying listed tasks does not leak into later listings."""
+    manager = TodoManager()
+    manager.add_task("First task")
+    manager._cached_tasks()
+
+    tasks = manager.get_all_tasks()
+    tasks[0].title = "Changed"
+    tasks.append(Task(99, "Extra"))
+
+    assert [task.title for task in manager.get_all_tasks()] == ["First task"]
+    assert [task.title for task in manager._cached_tasks()] == ["First task"]
+    assert manager.get_task(1).title == "First task"
+
+
+def test_task_string_representations():
+    """Test that string representations follow field changes."""
+    task = Task(1, "Write report", "Quarterly numbers")
+    assert str(task) == "[○] 1: Write report"
+    assert "Status: Pending" in task.to_detailed_str()
+
+    task.completed = True
+    task.title = "Send report"
+    task.description = "To the team"
+    assert str(task) == "[✓] 1: Send report"
+    detail = task.to_detailed_str()
+    assert "Title: Send report" in detail
+    assert "Status: Completed" in detail
+    assert "Description: To the team" in detail
+
+
+def test_task_rejects_unknown_attributes():
+    """Test that Task does not accept attributes outside its declared fields."""
+    task = Task(1, "Write report")
+
+    with pytest.raises(AttributeError):
+        task.priority = "high"
+
+
+@pytest.mark.parametrize("text, expected", [("1", 1), ("42", 42), ("-3", -3)])
+def test_parse_id(text, expected):
+    """Test parsing of numeric task IDs."""
+    assert _parse_id(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "-", "abc", "1a", "1.5", "--1", "²", "1" * 5000])
+def test_parse_id_rejects_non_numeric(text):
+    """Test that non-numeric task IDs are rejected."""
+    assert _parse_id(text) is None
+
+
+def test_cli_add_and_update_keep_description_spacing(monkeypatch):
+    """Test that add/update descriptions keep their inner spacing."""
+    cli = run_cli(monkeypatch, "add Groceries milk,  bread   and eggs", "add Call", "update 2 Phone mom  tonight")
+
+    assert cli.manager.get_task(1).title == "Groceries"
+    assert cli.manager.get_task(1).description == "milk,  bread   and eggs"
+    assert cli.manager.get_task(2).title == "Phone"
+    assert cli.manager.get_task(2).description == "mom  tonight"
+
+
+@pytest.mark.parametrize("line, title, description", [
+    ("update 1 . New  description", "Title", "New  description"),
+    ("update 1 Renamed .", "Renamed", "Original"),
+    ("update 1 Renamed . ignored words", "Renamed", "Original"),
+    ("update 1 . .", "Title", "Original"),
+])
+def test_cli_update_dot_marker(monkeypatch, line, title, description):
+    """Test that '.' leaves the title or description unchanged."""
+    cli = run_cli(monkeypatch, "add Title Original", line)
+
+    task = cli.manager.get_task(1)
+    assert task.title == title
+    assert task.description == description
+
+
+def test_cli_dispatch(monkeypatch, capsys):
+    """Test command dispatch, unknown commands and quitting."""
+    cli = run_cli(monkeypatch, "ADD First", "bogus", "complete 1", "quit", "add Never")
 
-    try:
-        test_task_creation()
-        test_task_validation()
-        test_task_operations()
-        test_task_not_found()
-        test_task_update_partial()
+    output = capsys.readouterr().out
+    assert "Unknown command: 'bogus'" in output
+    assert "✓ Task 1 completed" in output
+    assert output.rstrip().endswith("Goodbye!")
+    assert [task.title for task in cli.manager.get_all_tasks()] == ["First"]
+    assert cli.manager.get_task(1).completed == True
 
-        print("\nSUCCESS: All tests passed successfully!")
-        return True
-    except Exception as e:
-        print(f"\nERROR: Test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
 
+def test_cli_stops_at_end_of_input(monkeypatch, capsys):
+    """Test that the CLI exits cleanly when piped input runs out."""
+    cli = run_cli(monkeypatch, "add Groceries", "list")
 
-if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    output = capsys.readouterr().out
+    assert "[○] 1: Groceries" in output
+    assert output.rstrip().endswith("Goodbye!")
+    assert len(cli.manager.get_all_tasks()) == 1
@@ -6,14 +6,35 @@ This application implements the Phase I specifications for the
 "Hackathon II – The Evolution of Todo" project.
 """
 
+import itertools
 import sys
-from typing import Optional, Dict, List
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Tuple
 
+# Status labels indexed by the completion flag (False -> 0, True -> 1)
+_STATUS_GLYPH = ("○", "✓")
+_STATUS_WORD = ("Pending", "Completed")
 
+# Fixed command vocabulary mapped to small integer tokens. Tokens index
+# _ARG_SPLITS and the _HANDLERS table defined after TodoCLI.
+_CMD_TOKEN = {
+    'add': 0, 'list': 1, 'show': 2, 'update': 3, 'complete': 4,
+    'delete': 5, 'help': 6, 'quit': 7, 'exit': 7,
+}
+_CMD_QUIT = 7
+
+# Maximum argument splits per command token (-1 means split every word);
+# add and update keep their trailing free text as a single argument
+_ARG_SPLITS = (1, -1, -1, 2, -1, -1, -1)
+
+
+@dataclass(slots=True, eq=False)
 class Task:
     """
     Represents a Todo task with id, title, description, and completion status.
 
+    The title is validated and stripped in __post_init__.
+
     Attributes:
         id (int): Unique identifier for the task
         title (str): Required title of the task
@@ -21,35 +42,44 @@ class Task:
         completed (bool): Whether the task is completed (default False)
     """
 
-    def __init__(self, task_id: int, title: str, description: Optional[str] = None, completed: bool = False):
-        """
-        Initialize a Task instance.
+    id: int
+    title: str
+    description: Optional[str] = None
+    completed: bool = False
 
-        Args:
-            task_id (int): Unique identifier for the task
-            title (str): Required title of the task
-            description (Optional[str]): Optional description of the task
-            completed (bool): Whether the task is completed (default False)
-        """
-        if not title or not title.strip():
+    def __post_init__(self):
+        """Validate the title and strip surrounding whitespace from text fields."""
+        if not self.title or not self.title.strip():
             raise ValueError("Task title cannot be empty")
 
-        self.id = task_id
-        self.title = title.strip()
-        self.description = description.strip() if description else None
-        self.completed = completed
+        self.title = self.title.strip()
+        self.description = self.description.strip() if self.description else None
+
+    @classmethod
+    def _from_trusted(cls, task_id: int, title: str, description: Optional[str] = None,
+                      completed: bool = False) -> 'Task':
+        """
+        Build a Task from values that are already validated and stripped.
+
+        Used by TodoManager, which cleans its inputs once before storing
+        them, to skip the checks done in __post_init__.
+        """
+        task = cls.__new__(cls)
+        task.id = task_id
+        task.title = title
+        task.description = description
+        task.completed = completed
+        return task
 
     def __str__(self) -> str:
         """String representation of the task."""
-        status = "✓" if self.completed else "○"
-        return f"[{status}] {self.id}: {self.title}"
+        return f"[{_STATUS_GLYPH[self.completed]}] {self.id}: {self.title}"
 
     def to_detailed_str(self) -> str:
         """Detailed string representation of the task."""
-        status = "Completed" if self.completed else "Pending"
         result = f"ID: {self.id}\n"
         result += f"Title: {self.title}\n"
-        result += f"Status: {status}\n"
+        result += f"Status: {_STATUS_WORD[self.completed]}\n"
         if self.description:
             result += f"Description: {self.description}\n"
         return result
@@ -64,15 +94,36 @@ class TodoManager:
     """
 
     def __init__(self):
-        """Initialize the TodoManager with an empty task list."""
-        self._tasks: Dict[int, Task] = {}
-        self._next_id = 1
+        """
+        Initialize the TodoManager with empty task storage.
+
+        Tasks are stored column-wise (one list per field) rather than as a
+        dictionary of Task objects, so that listing and filtering walk
+        contiguous arrays. Row order always matches insertion order, and
+        the read-only listing snapshot from _cached_tasks is kept until the
+        next change to the collection.
+
+        Deleted rows are only marked dead in the _live flags, so deletion
+        never shifts rows or reindexes; the columns are compacted once dead
+        rows outnumber live ones.
+        """
+        self._ids: List[int] = []
+        self._titles: List[str] = []
+        self._descs: List[Optional[str]] = []
+        self._completed: bytearray = bytearray()
+        self._live: bytearray = bytearray()
+        self._dead = 0
+        self._index: Dict[int, int] = {}
+        self._all_cache: Optional[Tuple[Task, ...]] = None
+        self._id_counter = itertools.count(1)
 
     def _generate_id(self) -> int:
         """Generate a unique ID for a new task."""
-        new_id = self._next_id
-        self._next_id += 1
-        return new_id
+        return next(self._id_counter)
+
+    def _row_to_task(self, idx: int) -> Task:
+        """Build a Task snapshot from the storage row at the given index."""
+        return Task._from_trusted(self._ids[idx], self._titles[idx], self._descs[idx], bool(self._completed[idx]))
 
     def add_task(self, title: str, description: Optional[str] = None) -> Task:
         """
@@ -88,13 +139,41 @@ class TodoManager:
         Raises:
             ValueError: If title is empty
         """
-        if not title or not title.strip():
-            raise ValueError("Task title cannot be empty")
+        added, task, error = self.try_add_task(title, description)
+        if not added:
+            raise ValueError(error)
+        return task
+
+    def try_add_task(self, title: str, description: Optional[str] = None) -> Tuple[bool, Optional[Task], str]:
+        """
+        Add a new task, reporting invalid input instead of raising.
 
+        Args:
+            title (str): Required title of the task
+            description (Optional[str]): Optional description of the task
+
+        Returns:
+            Tuple[bool, Optional[Task], str]: Whether the task was added, the
+            new task (None on failure) and an error message ("" on success)
+        """
+        title_clean = title.strip() if title else ""
+        if not title_clean:
+            return False, None, "Task title cannot be empty"
+
+        desc_clean = description.strip() if description else None
+        return True, self._add_task_checked(title_clean, desc_clean), ""
+
+    def _add_task_checked(self, title_clean: str, desc_clean: Optional[str]) -> Task:
+        """Store a new task whose title and description are already validated and stripped."""
         task_id = self._generate_id()
-        task = Task(task_id, title, description, completed=False)
-        self._tasks[task_id] = task
-        return task
+        self._index[task_id] = len(self._ids)
+        self._ids.append(task_id)
+        self._titles.append(title_clean)
+        self._descs.append(desc_clean)
+        self._completed.append(0)
+        self._live.append(1)
+        self._all_cache = None
+        return Task._from_trusted(task_id, title_clean, desc_clean)
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """
@@ -106,16 +185,51 @@ class TodoManager:
         Returns:
             Optional[Task]: The task if found, None otherwise
         """
-        return self._tasks.get(task_id)
+        idx = self._index.get(task_id)
+        if idx is None:
+            return None
+        return self._row_to_task(idx)
+
+    def _iter_tasks(self):
+        """Yield a new Task for every live row, in insertion order."""
+        for task_id, title, desc, done, alive in zip(
+                self._ids, self._titles, self._descs, self._completed, self._live):
+            if alive:
+                yield Task._from_trusted(task_id, title, desc, bool(done))
 
     def get_all_tasks(self) -> List[Task]:
         """
         Retrieve all tasks in the collection.
 
         Returns:
-            List[Task]: All tasks in the collection
+            List[Task]: All tasks in the collection, in insertion order
+        """
+        return list(self._iter_tasks())
+
+    def _cached_tasks(self) -> Tuple[Task, ...]:
+        """
+        Return a snapshot of all tasks that is reused until the next change.
+
+        The tuple and its tasks are shared between calls, so it is only for
+        read-only use inside the application (e.g. the 'list' command);
+        callers must not modify the tasks in it.
+        """
+        if self._all_cache is None:
+            self._all_cache = tuple(self._iter_tasks())
+        return self._all_cache
+
+    def count_completed(self) -> int:
+        """
+        Count the tasks that are marked as completed.
+
+        Completion flags are kept one byte per task, so this is a single
+        pass over the flag array without building any Task objects. Dead
+        rows have their flag cleared on deletion, so they never count.
+
+        Returns:
+            int: Number of completed tasks
         """
-        return list(self._tasks.values())
+        return sum(self._completed)
 
     def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None) -> bool:
         """
@@ -128,24 +242,43 @@ class TodoManager:
 
         Returns:
             bool: True if task was updated, False if task not found
-        """
-        task = self.get_task(task_id)
-        if not task:
-            return False
 
+        Raises:
+            ValueError: If the new title is empty and the task exists
+        """
         # Validate new title if provided
         if title is not None:
-            if not title or not title.strip():
+            title = title.strip()
+            if not title:
+                if task_id not in self._index:
+                    return False
                 raise ValueError("Task title cannot be empty")
-            task.title = title.strip()
 
-        # Update description if provided
         if description is not None:
-            task.description = description.strip() if description else None
+            description = description.strip()
+
+        return self._update_task_trusted(task_id, title, description)
 
+    def _update_task_trusted(self, task_id: int, title: Optional[str], description: Optional[str]) -> bool:
+        """
+        Update a task with values that are already validated and stripped.
+
+        A None title or description leaves that field unchanged; an empty
+        description clears it.
+        """
+        idx = self._index.get(task_id)
+        if idx is None:
+            return False
+
+        if title is not None:
+            self._titles[idx] = title
+        if description is not None:
+            self._descs[idx] = description or None
+
+        self._all_cache = None
         return True
 
-    def toggle_completion(self, task_id: int) -> bool:
+    def toggle_completion(self, task_id: int) -> Optional[bool]:
         """
         Toggle the completion status of a task.
 
@@ -153,29 +286,77 @@ class TodoManager:
             task_id (int): ID of the task to toggle
 
         Returns:
-            bool: True if task status was toggled, False if task not found
+            Optional[bool]: The new completion status, or None if task not found
         """
-        task = self.get_task(task_id)
-        if not task:
-            return False
+        idx = self._index.get(task_id)
+        if idx is None:
+            return None
 
-        task.completed = not task.completed
-        return True
+        self._completed[idx] ^= 1
+        self._all_cache = None
+        return bool(self._completed[idx])
 
     def delete_task(self, task_id: int) -> bool:
         """
         Delete a task from the collection.
 
+        The row is marked dead rather than removed, so deletion is O(1)
+        and the remaining rows keep their positions and order.
+
         Args:
             task_id (int): ID of the task to delete
 
         Returns:
             bool: True if task was deleted, False if task not found
         """
-        if task_id in self._tasks:
-            del self._tasks[task_id]
-            return True
-        return False
+        idx = self._index.pop(task_id, None)
+        if idx is None:
+            return False
+
+        self._live[idx] = 0
+        self._completed[idx] = 0
+        self._titles[idx] = ""
+        self._descs[idx] = None
+        self._dead += 1
+        if self._dead * 2 > len(self._ids):
+            self._compact()
+        self._all_cache = None
+        return True
+
+    def _compact(self):
+        """Drop dead rows from the columns and rebuild the row index."""
+        live = self._live
+        self._ids = list(itertools.compress(self._ids, live))
+        self._titles = list(itertools.compress(self._titles, live))
+        self._descs = list(itertools.compress(self._descs, live))
+        self._completed = bytearray(itertools.compress(self._completed, live))
+        self._live = bytearray(b"\x01") * len(self._ids)
+        self._index = {task_id: idx for idx, task_id in enumerate(self._ids)}
+        self._dead = 0
+
+
+# Longest task ID accepted on the command line; far beyond any real ID
+_MAX_ID_DIGITS = 18
+
+
+def _parse_id(text: str) -> Optional[int]:
+    """
+    Parse a task ID typed on the command line.
+
+    The text is checked up front so that invalid input returns None
+    without raising and catching a ValueError. The digit count is capped
+    because int() rejects very long strings (over 4300 digits).
+
+    Args:
+        text (str): Command argument holding the ID
+
+    Returns:
+        Optional[int]: The parsed ID, or None if the text is not an integer
+    """
+    digits = text[1:] if text[:1] in ('-', '+') else text
+    if not digits.isdecimal() or len(digits) > _MAX_ID_DIGITS:
+        return None
+    return int(text)
 
 
 class TodoCLI:
@@ -218,16 +399,16 @@ class TodoCLI:
             return False
 
         title = args[0]
-        description = " ".join(args[1:]) if len(args) > 1 else None
+        description = args[1] if len(args) > 1 else None
 
-        try:
-            task = self.manager.add_task(title, description)
-            print(f"✓ Added task: [{task.id}] {task.title}")
-            return True
-        except ValueError as e:
-            print(f"ERROR: {e}")
+        added, task, error = self.manager.try_add_task(title, description)
+        if not added:
+            print(f"ERROR: {error}")
             return False
 
+        print(f"✓ Added task: [{task.id}] {task.title}")
+        return True
+
     def handle_list(self, args: List[str]) -> bool:
         """
         Handle the 'list' command to display all tasks.
@@ -238,16 +419,17 @@ class TodoCLI:
         Returns:
             bool: True if successful, False otherwise
         """
-        tasks = self.manager.get_all_tasks()
+        tasks = self.manager._cached_tasks()
 
         if not tasks:
             print("No tasks found.")
             return True
 
-        print("\nYOUR TASKS:")
-        for task in tasks:
-            print(f"  {task}")
-        print()
+        # Build the whole listing first and emit it with a single write
+        lines = ["", "YOUR TASKS:"]
+        lines.extend(f"  {task}" for task in tasks)
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         return True
 
     def handle_show(self, args: List[str]) -> bool:
@@ -264,9 +446,8 @@ class TodoCLI:
             print("ERROR: Please provide a task ID.")
             return False
 
-        try:
-            task_id = int(args[0])
-        except ValueError:
+        task_id = _parse_id(args[0])
+        if task_id is None:
             print("ERROR: Task ID must be a number.")
             return False
 
@@ -293,33 +474,24 @@ class TodoCLI:
             print("ERROR: Please provide task ID, and at least one field to update.")
             return False
 
-        try:
-            task_id = int(args[0])
-        except ValueError:
+        task_id = _parse_id(args[0])
+        if task_id is None:
             print("ERROR: Task ID must be a number.")
             return False
 
         # Extract title and description from remaining args
         title = args[1] if args[1] != '.' else None  # Use '.' to indicate no change
-        description = " ".join(args[2:]) if len(args) > 2 and args[2] != '.' else None
-
-        # If title is '.', replace with None to indicate no change
-        if title == '.':
-            title = None
-        if description and description == '.':
-            description = None
-
-        try:
-            updated = self.manager.update_task(task_id, title, description)
-            if updated:
-                print(f"✓ Updated task {task_id}")
-                return True
-            else:
-                print(f"ERROR: Task with ID {task_id} not found.")
-                return False
-        except ValueError as e:
-            print(f"ERROR: {e}")
-            return False
+        # The description is the rest of the line; a leading '.' word still
+        # means "no change", whatever follows it
+        description = args[2] if len(args) > 2 and args[2].split(maxsplit=1)[0] != '.' else None
+
+        # Arguments come from splitting the stripped input line, so they are
+        # already non-empty and free of surrounding whitespace
+        if self.manager._update_task_trusted(task_id, title, description):
+            print(f"✓ Updated task {task_id}")
+            return True
+        print(f"ERROR: Task with ID {task_id} not found.")
+        return False
 
     def handle_complete(self, args: List[str]) -> bool:
         """
@@ -335,27 +507,19 @@ class TodoCLI:
             print("ERROR: Please provide a task ID.")
             return False
 
-        try:
-            task_id = int(args[0])
-        except ValueError:
+        task_id = _parse_id(args[0])
+        if task_id is None:
             print("ERROR: Task ID must be a number.")
             return False
 
-        task = self.manager.get_task(task_id)
-        if not task:
+        new_state = self.manager.toggle_completion(task_id)
+        if new_state is None:
             print(f"ERROR: Task with ID {task_id} not found.")
             return False
 
-        was_completed = task.completed
-        updated = self.manager.toggle_completion(task_id)
-
-        if updated:
-            status = "completed" if not was_completed else "marked incomplete"
-            print(f"✓ Task {task_id} {status}")
-            return True
-        else:
-            print(f"ERROR: Could not update task {task_id}.")
-            return False
+        status = "completed" if new_state else "marked incomplete"
+        print(f"✓ Task {task_id} {status}")
+        return True
 
     def handle_delete(self, args: List[str]) -> bool:
         """
@@ -371,9 +535,8 @@ class TodoCLI:
             print("ERROR: Please provide a task ID.")
             return False
 
-        try:
-            task_id = int(args[0])
-        except ValueError:
+        task_id = _parse_id(args[0])
+        if task_id is None:
             print("ERROR: Task ID must be a number.")
             return False
 
@@ -386,43 +549,52 @@ class TodoCLI:
             return False
 
     def run(self):
-        """Run the main CLI loop."""
+        """
+        Run the main CLI loop.
+
+        When stdin is not a terminal (e.g. commands piped in from a script),
+        lines are read straight from sys.stdin instead of through input().
+        """
         print("Welcome to the CLI Todo Application!")
         print("Type 'help' for available commands.")
 
+        # Bind frequently used objects to locals for the loop below
+        cmd_token = _CMD_TOKEN
+        arg_splits = _ARG_SPLITS
+        handlers = _HANDLERS
+        stdin = sys.stdin
+        stdout_write = sys.stdout.write
+        interactive = stdin.isatty()
+
         while True:
             try:
                 # Get user input
-                user_input = input("\ntodo> ").strip()
+                if interactive:
+                    user_input = input("\ntodo> ").strip()
+                else:
+                    stdout_write("\ntodo> ")
+                    line = stdin.readline()
+                    if not line:
+                        raise EOFError
+                    user_input = line.strip()
 
                 if not user_input:
                     continue
 
-                # Parse command
-                parts = user_input.split()
+                # Parse command; free-text commands keep the rest of the line intact
+                parts = user_input.split(maxsplit=1)
                 command = parts[0].lower()
-                args = parts[1:]
+                rest = parts[1] if len(parts) > 1 else ""
 
-                # Handle different commands
-                if command in ['quit', 'exit']:
+                # Dispatch to the command handler by token
+                tok = cmd_token.get(command, -1)
+                if tok < 0:
+                    print(f"Unknown command: '{command}'. Type 'help' for available commands.")
+                elif tok == _CMD_QUIT:
                     print("Goodbye!")
                     break
-                elif command == 'help':
-                    self.print_help()
-                elif command == 'add':
-                    self.handle_add(args)
-                elif command == 'list':
-                    self.handle_list(args)
-                elif command == 'show':
-                    self.handle_show(args)
-                elif command == 'update':
-                    self.handle_update(args)
-                elif command == 'complete':
-                    self.handle_complete(args)
-                elif command == 'delete':
-                    self.handle_delete(args)
                 else:
-                    print(f"Unknown command: '{command}'. Type 'help' for available commands.")
+                    handlers[tok](self, rest.split(maxsplit=arg_splits[tok]))
 
             except KeyboardInterrupt:
                 print("\n\nGoodbye!")
@@ -432,6 +604,18 @@ class TodoCLI:
                 break
 
 
+# Unbound command handlers indexed by command token
+_HANDLERS = (
+    TodoCLI.handle_add,
+    TodoCLI.handle_list,
+    TodoCLI.handle_show,
+    TodoCLI.handle_update,
+    TodoCLI.handle_complete,
+    TodoCLI.handle_delete,
+    lambda cli, args: cli.print_help(),
+)
+
+
 def main():
     """Main entry point for the application."""
     cli = TodoCLI()